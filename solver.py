@@ -1,11 +1,20 @@
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Sequence, Iterable, Tuple, Optional
+from typing import Dict, List, Sequence, Iterable, Iterator, Tuple, Optional
+from array import array
+from bisect import bisect_left
 from collections import Counter
-from functools import lru_cache
+from itertools import accumulate, chain, repeat
+import hashlib
+import importlib.machinery
+import importlib.util
+import os
 import re
+import struct
 import sys
+import tempfile
+import warnings
 
 """
 NYT Spelling Bee Solver (curated)
@@ -34,6 +43,10 @@ MIN_ZIPF = 3.6         # Word frequency threshold (3.5-4.5 recommended)
                        # Higher = fewer, more common words
 SHOW_TOP_N = 50        # How many words to display
 SHOW_HINTS = False     # Set to True for hints without spoilers
+BUILD_AOT_FILTER = False  # Set to True once to compile the word filter
+                          # (needs numba and a C compiler)
+USE_NUMBA_JIT = False  # Set to True to JIT the word filter with numba when no
+                       # AOT build exists (~0.5s import; only pays off on huge lists)
 # ============================================================
 
 try:
@@ -43,6 +56,19 @@ except ImportError:
     zipf_frequency = None
     WORDFREQ_AVAILABLE = False
 
+# numpy is only needed by the compiled filter kernel, so it is imported on demand
+np = None
+
+def _import_numpy() -> bool:
+    """Bind the module-level `np`; False if numpy is not installed"""
+    global np
+    if np is None:
+        try:
+            import numpy as np
+        except ImportError:
+            return False
+    return True
+
 WORDLIST = Path(__file__).parent / "wordlist.txt"
 
 @dataclass(frozen=True)
@@ -53,76 +79,391 @@ class WordResult:
     length: int
     zipf_score: float = 0.0
 
-_WORD_RE = re.compile(r"^[a-z]+$")
-EXCLUDE_PATTERNS = [
-    r"^.{15,}$",  # extremely long words
-    r".*[qxz]{2,}.*",  # multiple rare letters
-]
-
-@lru_cache(maxsize=50000)
-def _get_zipf(word: str) -> float:
-    """Cached Zipf frequency lookup for performance"""
-    if zipf_frequency is None:
-        return 0.0
-    return zipf_frequency(word, "en")
-
-def _load_words(path: Path) -> Iterable[str]:
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            w = line.strip().lower()
-            if _WORD_RE.match(w):
-                yield w
+@dataclass
+class WordResults:
+    """Solver output stored column-wise; row i is only built as a WordResult when indexed"""
+    words: List[str] = field(default_factory=list)
+    scores: List[int] = field(default_factory=list)
+    is_pangram: List[bool] = field(default_factory=list)
+    lengths: List[int] = field(default_factory=list)
+    zipf_scores: List[float] = field(default_factory=list)
 
-def _is_likely_plural(word: str) -> bool:
-    """Filter obvious plurals that NYT typically excludes."""
-    if not word.endswith('s') or len(word) <= 4:
-        return False
-    if word.endswith('ss'):
-        return False
-    non_plural_endings = ['ous', 'ness', 'less', 'ious', 'us']
-    for ending in non_plural_endings:
-        if word.endswith(ending):
-            return False
-    return True
+    def __len__(self) -> int:
+        return len(self.words)
 
-def _is_obscure_word(word: str) -> bool:
-    """Additional heuristics to filter uncommon words"""
-    for pattern in EXCLUDE_PATTERNS:
-        if re.match(pattern, word):
-            return True
-    if len(word) >= 6:
-        for char in set(word):
-            if word.count(char) >= len(word) * 0.6:
-                return True
-    return False
+    def __getitem__(self, i: int | slice) -> WordResult | WordResults:
+        if isinstance(i, slice):
+            return self.take(range(*i.indices(len(self))))
+        return WordResult(
+            word=self.words[i],
+            score=self.scores[i],
+            is_pangram=self.is_pangram[i],
+            length=self.lengths[i],
+            zipf_score=self.zipf_scores[i],
+        )
 
-def _is_valid_word(
-    word: str, 
-    letters_set: set, 
-    center: str, 
-    min_len: int = 4,
-    filter_plurals: bool = True,
-    filter_obscure: bool = True
-) -> bool:
-    if len(word) < min_len:
+    def __iter__(self) -> Iterator[WordResult]:
+        return map(self.__getitem__, range(len(self)))
+
+    def take(self, order: Sequence[int]) -> WordResults:
+        """New WordResults with rows reordered/selected by `order`"""
+        return WordResults(
+            words=[self.words[i] for i in order],
+            scores=[self.scores[i] for i in order],
+            is_pangram=[self.is_pangram[i] for i in order],
+            lengths=[self.lengths[i] for i in order],
+            zipf_scores=[self.zipf_scores[i] for i in order],
+        )
+
+# ASCII A-Z -> a-z in one bytes.translate pass over the whole file
+_LOWER_TABLE = bytes.maketrans(bytes(range(65, 91)), bytes(range(97, 123)))
+# Matched against the whole lowered file at once; blanks around the word and CRLF
+# are tolerated like the old per-line str.strip()
+_WORD_RE = re.compile(r"(?m)^[ \t]*([a-z]+)[ \t\r]*$")
+
+# Bit (ord(c) - 97) per lowercase letter; dict lookup beats recomputing the shift
+_LETTER_BITS = {chr(97 + i): 1 << i for i in range(26)}
+
+def _letter_mask(letters: Iterable[str]) -> int:
+    """26-bit mask with one bit set for each letter in `letters`"""
+    m = 0
+    for c in letters:
+        m |= _LETTER_BITS[c]
+    return m
+
+# Obscurity heuristics: the mask decides whether the run regex needs to run at all
+_MAX_WORD_LEN = 15  # extremely long words
+_RARE_MASK = _letter_mask("qxz")
+_RARE_RUN_RE = re.compile(r"[qxz]{2}")  # multiple rare letters
+
+def _load_words(path: Path) -> List[str]:
+    text = path.read_bytes().translate(_LOWER_TABLE)
+    # latin-1 maps bytes 1:1, so non-ASCII lines simply fail the [a-z] match
+    return _WORD_RE.findall(text.decode("latin-1"))
+
+# (blob, offsets, length_starts): words sorted by length and packed back to back.
+# Word i is blob[offsets[i]:offsets[i + 1]]; words of length n are the indices
+# length_starts[n]:length_starts[n + 1].
+WordIndex = Tuple[bytes, "array[int]", "array[int]"]
+
+_WORD_INDEX_CACHE: Dict[Path, Tuple[Tuple[int, int], WordIndex]] = {}
+
+def _build_word_index(path: Path) -> WordIndex:
+    words = sorted(_load_words(path), key=len)
+    lengths = [len(w) for w in words]
+    offsets = array("i", [0])
+    offsets.extend(accumulate(lengths))
+    max_n = lengths[-1] if lengths else 0
+    length_starts = array("i", (bisect_left(lengths, n) for n in range(max_n + 2)))
+    return "".join(words).encode("ascii"), offsets, length_starts
+
+# Raw cache layout: header, then the blob, then both arrays as native array('i').
+# Bump the magic whenever the index layout or the word parsing changes.
+_INDEX_MAGIC = b"SBIDX\x00\x00\x01"
+_INDEX_HEADER = struct.Struct("<8sqqqqqB1s")  # magic, mtime_ns, size, blob/offsets/starts lengths, itemsize, byteorder
+
+def _read_word_index(cache_path: Path, key: Tuple[int, int]) -> Optional[WordIndex]:
+    """Index stored for `key`, or None if the cache is missing, stale or malformed"""
+    try:
+        with cache_path.open("rb") as f:
+            header = f.read(_INDEX_HEADER.size)
+            if len(header) != _INDEX_HEADER.size:
+                return None
+            (magic, mtime_ns, size, n_blob, n_offsets, n_starts,
+             itemsize, byteorder) = _INDEX_HEADER.unpack(header)
+            if (magic != _INDEX_MAGIC or (mtime_ns, size) != key or itemsize != array("i").itemsize
+                    or byteorder != sys.byteorder[0].encode()):
+                return None
+            blob = f.read(n_blob)
+            offsets = array("i")
+            offsets.fromfile(f, n_offsets)
+            length_starts = array("i")
+            length_starts.fromfile(f, n_starts)
+    except (OSError, EOFError, ValueError, struct.error):
+        return None
+    # Both filter paths trust the index (the numba kernel has no bounds checks and
+    # the Python path no longer re-checks lengths), so reject anything inconsistent
+    if (len(blob) != n_blob or not offsets or offsets[0] != 0 or offsets[-1] != n_blob
+            or not length_starts or length_starts[0] != 0 or length_starts[-1] != n_offsets - 1):
+        return None
+    if blob and not (blob.isalpha() and blob.islower()):  # bytes checks are ASCII-only: [a-z]+
+        return None
+    if any(a > b for a, b in zip(length_starts, length_starts[1:])):
+        return None
+    # Words are sorted by length, so length_starts fixes every offset
+    bucket_sizes = [b - a for a, b in zip(length_starts, length_starts[1:])]
+    if np is not None:
+        lengths = np.repeat(np.arange(len(bucket_sizes)), bucket_sizes)
+        if not np.array_equal(np.frombuffer(offsets, dtype=np.int32)[1:], np.cumsum(lengths)):
+            return None
+    else:
+        lengths = chain.from_iterable(repeat(n, k) for n, k in enumerate(bucket_sizes))
+        if offsets[1:] != array("i", accumulate(lengths)):
+            return None
+    return blob, offsets, length_starts
+
+def _write_word_index(cache_path: Path, key: Tuple[int, int], index: WordIndex) -> None:
+    blob, offsets, length_starts = index
+    header = _INDEX_HEADER.pack(
+        _INDEX_MAGIC, key[0], key[1], len(blob), len(offsets), len(length_starts),
+        offsets.itemsize, sys.byteorder[0].encode(),
+    )
+    # Write to a temp file and rename so readers never see a partial cache
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header)
+            f.write(blob)
+            offsets.tofile(f)
+            length_starts.tofile(f)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        os.unlink(tmp_name)
+        raise
+
+def _load_word_index(path: Path) -> WordIndex:
+    """Packed wordlist, cached in-process and in a raw file next to the wordlist"""
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _WORD_INDEX_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Appended, not a suffix swap, so the cache can never be the wordlist itself
+    cache_path = path.with_name(path.name + ".sbidx")
+    index = _read_word_index(cache_path, key)
+    if index is None:
+        index = _build_word_index(path)
+        if cache_path != path:
+            try:
+                _write_word_index(cache_path, key, index)
+            except OSError:
+                pass  # read-only location; just rebuild next time
+    _WORD_INDEX_CACHE[path] = (key, index)
+    return index
+
+def _length_range(length_starts: "array[int]", min_len: int, max_len: Optional[int]) -> Tuple[int, int]:
+    """Word index range [lo, hi) covering lengths min_len..max_len (max_len=None: no cap)"""
+    top = len(length_starts) - 1
+    lo = length_starts[min(max(min_len, 0), top)]
+    hi = length_starts[top if max_len is None else min(max(max_len + 1, 0), top)]
+    return lo, max(lo, hi)
+
+def _filter_words_kernel(buf, offs, letters_mask, center_bit, min_len, max_len):
+    """Indices of words passing the length, center and letter-subset checks (max_len <= 0: no cap)
+
+    Words are independent, so each prange iteration writes only its own
+    `survive` slot; NUMBA_NUM_THREADS caps the thread count. AOT builds
+    have no threading, so there prange runs as a plain range.
+    """
+    n = len(offs) - 1
+    survive = np.zeros(n, dtype=np.uint8)
+    for i in prange(n):
+        start = offs[i]
+        end = offs[i + 1]
+        length = end - start
+        if length < min_len or (max_len > 0 and length > max_len):
+            continue
+        m = 0
+        for j in range(start, end):
+            m |= 1 << (buf[j] - 97)
+            if m & ~letters_mask:
+                break
+        if m & center_bit and not m & ~letters_mask:
+            survive[i] = 1
+    return np.flatnonzero(survive)
+
+# Compiled once with numba.pycc so later runs skip both the numba import and JIT
+_AOT_PREFIX = "_spellingbee_filter_"
+_AOT_SIGNATURE = "i8[:](u1[:], i8[:], i8, i8, i8, i8)"
+
+def _aot_cache_dir() -> Optional[Path]:
+    """~/.cache/spellingbee, or None when no home directory can be resolved"""
+    try:
+        return Path.home() / ".cache" / "spellingbee"
+    except (RuntimeError, KeyError):
+        return None
+
+def _aot_module_name() -> str:
+    """Extension name keyed by the kernel's bytecode, its signature and the numpy ABI"""
+    code = _filter_words_kernel.__code__
+    key = repr((code.co_code, code.co_consts, code.co_names, _AOT_SIGNATURE, np.__version__))
+    return _AOT_PREFIX + hashlib.sha1(key.encode()).hexdigest()[:12]
+
+def _load_aot_filter():
+    cache_dir = _aot_cache_dir()
+    if cache_dir is None:
+        return None
+    # Only pay for the numpy import (needed for the exact name) if any build exists
+    suffixes = tuple(importlib.machinery.EXTENSION_SUFFIXES)
+    try:
+        if not any(p.name.endswith(suffixes) for p in cache_dir.glob(_AOT_PREFIX + "*")):
+            return None
+    except OSError:
+        return None
+    if not _import_numpy():
+        return None
+    name = _aot_module_name()
+    for suffix in suffixes:
+        path = cache_dir / (name + suffix)
+        if path.exists():
+            try:
+                spec = importlib.util.spec_from_file_location(name, path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                return module.filter_words
+            except (ImportError, OSError, AttributeError):
+                return None  # unusable build; fall back to the JIT/pure-Python path
+    return None
+
+def build_aot_filter(force: bool = False) -> bool:
+    """AOT-compile the filter kernel into the cache dir; False if numba or a C compiler is missing
+
+    A failed build leaves a marker so later calls don't retry it; pass
+    force=True to try again anyway.
+    """
+    cache_dir = _aot_cache_dir()
+    if cache_dir is None or not _import_numba():
         return False
-    if center not in word:
+    name = _aot_module_name()
+    failed_marker = cache_dir / (name + ".failed")
+    if failed_marker.exists() and not force:
         return False
-    if not set(word).issubset(letters_set):
+    final_file = name + importlib.machinery.EXTENSION_SUFFIXES[0]
+    tmp_file = f"{final_file}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # numba.pycc is pending deprecation
+            from numba.pycc import CC
+            cc = CC(name)  # raises if no C toolchain is found
+            cc.output_dir = str(cache_dir)
+            cc.output_file = tmp_file
+            cc.verbose = False
+            cc.export("filter_words", _AOT_SIGNATURE)(_filter_words_kernel)
+            cc.compile()
+        # Only a complete build ever appears under the importable name
+        os.replace(cache_dir / tmp_file, cache_dir / final_file)
+    except Exception:
+        try:
+            (cache_dir / tmp_file).unlink(missing_ok=True)
+            failed_marker.touch()
+        except OSError:
+            pass
         return False
-    if filter_plurals and _is_likely_plural(word):
+    failed_marker.unlink(missing_ok=True)
+    return True
+
+_aot_checked = False
+_aot_filter_words = None
+
+def _get_aot_filter():
+    """AOT-built kernel from the cache dir, looked up once on first use; None if there is none"""
+    global _aot_checked, _aot_filter_words
+    if not _aot_checked:
+        _aot_checked = True
+        _aot_filter_words = _load_aot_filter()
+    return _aot_filter_words
+
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+_jit_filter_words = None
+
+def _import_numba() -> bool:
+    """Bind njit/prange (the kernel looks prange up as a global); False if numba won't import"""
+    global NUMBA_AVAILABLE, njit, prange
+    if not NUMBA_AVAILABLE:
         return False
-    if filter_obscure and _is_obscure_word(word):
+    if not _import_numpy():
+        NUMBA_AVAILABLE = False
         return False
-    return True
+    try:
+        from numba import njit, prange
+    except ImportError:
+        NUMBA_AVAILABLE = False
+    return NUMBA_AVAILABLE
+
+def _get_filter_words():
+    """AOT-built kernel, else the JIT kernel if USE_NUMBA_JIT; None for the pure-Python path"""
+    global _jit_filter_words
+    aot_filter = _get_aot_filter()
+    if aot_filter is not None:
+        return aot_filter
+    if not USE_NUMBA_JIT or not _import_numba():
+        return None
+    if _jit_filter_words is None:
+        _jit_filter_words = njit(parallel=True, cache=True)(_filter_words_kernel)
+    return _jit_filter_words
+
+def _candidate_words(
+    path: Path,
+    allowed: str,
+    center: str,
+    letters_mask: int,
+    center_bit: int,
+    min_len: int,
+    max_len: Optional[int],
+) -> Iterable[str]:
+    """Words that use only `allowed` letters and contain `center`"""
+    blob, offsets, length_starts = _load_word_index(path)
+    lo, hi = _length_range(length_starts, min_len, max_len)
+    filter_words = _get_filter_words()
+    if filter_words is not None:
+        buf = np.frombuffer(blob, dtype=np.uint8)
+        offs = np.frombuffer(offsets, dtype=np.int32)[lo:hi + 1].astype(np.int64)
+        for i in filter_words(buf, offs, letters_mask, center_bit, min_len, max_len or 0):
+            yield blob[offs[i]:offs[i + 1]].decode("ascii")
+        return
+    text = blob.decode("ascii")
+    for start, end in zip(offsets[lo:hi], offsets[lo + 1:hi + 1]):
+        word = text[start:end]
+        # C-level reject: strip() leaves something behind iff a letter is outside the puzzle
+        if center not in word or word.strip(allowed):
+            continue
+        yield word
+
+# -ness/-less end in "ss" and -ous/-ious in "us", so two suffixes cover them all
+_NON_PLURAL_SUFFIXES = ('ss', 'us')
 
-def _is_pangram(word: str, letters_set: set) -> bool:
-    return set(word).issuperset(letters_set)
+def _is_likely_plural(word: str) -> bool:
+    """Filter obvious plurals that NYT typically excludes."""
+    return len(word) > 4 and word.endswith('s') and not word.endswith(_NON_PLURAL_SUFFIXES)
 
-def _score_word(word: str, letters_set: set, pangram_bonus: int = 7) -> Tuple[int, bool]:
-    is_pg = _is_pangram(word, letters_set)
+def _is_obscure_word(word: str, word_mask: int) -> bool:
+    """Additional heuristics to filter uncommon words"""
+    n = len(word)
+    if n >= _MAX_WORD_LEN:
+        return True
+    if word_mask & _RARE_MASK and _RARE_RUN_RE.search(word):
+        return True
+    # A letter filling 60% of the word needs the other distinct letters to fit in the rest
+    if n >= 6 and n - bin(word_mask).count("1") + 1 >= n * 0.6:
+        counts = [0] * 26
+        for c in word:
+            counts[ord(c) - 97] += 1
+        if max(counts) >= n * 0.6:
+            return True
+    return False
+
+def _zipf_threshold(length: int, min_zipf: float, aggressive: bool) -> float:
+    """Minimum Zipf score for a word of `length`; aggressive mode is stricter on long words"""
+    if aggressive:
+        if length >= 9:
+            return min_zipf + 0.5
+        if length >= 8:
+            return min_zipf + 0.3
+    return min_zipf
+
+def _score_word(word: str, is_pg: bool, pangram_bonus: int = 7) -> int:
     base = 1 if len(word) == 4 else len(word)
-    return base + (pangram_bonus if is_pg else 0), is_pg
+    return base + (pangram_bonus if is_pg else 0)
+
+def _result_order(words: List[str], scores: List[int]) -> Sequence[int]:
+    """Row order for (score desc, word asc)"""
+    # Only worth it when the kernel path has already imported numpy
+    if np is not None and words:
+        # np.array(words) is fixed-width <U{max len}, so lexsort compares in C
+        return np.lexsort((np.array(words), -np.array(scores))).tolist()
+    return sorted(range(len(words)), key=lambda i: (-scores[i], words[i]))
 
 def solve_spellingbee(
     letters: Sequence[str],
@@ -136,69 +477,87 @@ def solve_spellingbee(
     filter_plurals: bool = True,
     filter_obscure: bool = True,
     use_aggressive_filtering: bool = False,
-) -> List[WordResult]:
+) -> WordResults:
     """Returns sorted results by (score desc, word asc)."""
     letters = [c.lower() for c in letters]
     center = center.lower()
 
     uniq_letters = sorted(set(letters))
-    uniq_letters_set = set(uniq_letters)
     
     if len(uniq_letters) != 7:
         raise ValueError(f"Expected 7 distinct letters; got {len(uniq_letters)}")
     if center not in uniq_letters:
         raise ValueError(f"Center letter '{center}' must be among {uniq_letters}")
 
-    results: List[WordResult] = []
-    
-    for word in _load_words(Path(wordlist_path)):
-        if not _is_valid_word(word, uniq_letters_set, center, min_len, filter_plurals, filter_obscure):
-            continue
+    letters_mask = _letter_mask(uniq_letters)
+    center_bit = _letter_mask(center)
+    allowed = "".join(uniq_letters)
 
-        if max_len is not None and len(word) > max_len:
+    # Stage 1: cheap mask/heuristic filters
+    words: List[str] = []
+    masks: List[int] = []
+    candidates = _candidate_words(
+        Path(wordlist_path), allowed, center, letters_mask, center_bit, min_len, max_len
+    )
+    # Candidates already satisfy the length range, center and letter-subset rules;
+    # the mask is still needed for pangrams and the obscurity heuristic
+    for word in candidates:
+        word_mask = 0
+        for c in word:
+            word_mask |= _LETTER_BITS[c]
+        if ((filter_plurals and _is_likely_plural(word))
+                or (filter_obscure and _is_obscure_word(word, word_mask))):
             continue
 
-        zipf_score = 0.0
-        if min_zipf is not None and zipf_frequency is not None:
-            zipf_score = _get_zipf(word)
-            if zipf_score < min_zipf:
-                continue
-            
-            if use_aggressive_filtering:
-                if len(word) >= 8 and zipf_score < min_zipf + 0.3:
-                    continue
-                if len(word) >= 9 and zipf_score < min_zipf + 0.5:
-                    continue
-
-        score, is_pg = _score_word(word, uniq_letters_set, pangram_bonus)
-        results.append(WordResult(
-            word=word, 
-            score=score, 
-            is_pangram=is_pg, 
-            length=len(word),
-            zipf_score=zipf_score
-        ))
-
-    results.sort(key=lambda r: (-r.score, r.word))
-    return results
-
-def print_hints(results: List[WordResult]) -> None:
+        words.append(word)
+        masks.append(word_mask)
+
+    # Stage 2: one batched frequency lookup over the few survivors
+    zipf_scores = [0.0] * len(words)
+    keep: Iterable[int] = range(len(words))
+    if min_zipf is not None and zipf_frequency is not None:
+        zipf_scores = [zipf_frequency(w, "en") for w in words]
+        keep = [
+            i for i, z in enumerate(zipf_scores)
+            if z >= _zipf_threshold(len(words[i]), min_zipf, use_aggressive_filtering)
+        ]
+
+    results = WordResults()
+    for i in keep:
+        word = words[i]
+        is_pg = masks[i] == letters_mask
+        score = _score_word(word, is_pg, pangram_bonus)
+        results.words.append(word)
+        results.scores.append(score)
+        results.is_pangram.append(is_pg)
+        results.lengths.append(len(word))
+        results.zipf_scores.append(zipf_scores[i])
+
+    return results.take(_result_order(results.words, results.scores))
+
+def print_hints(results: WordResults) -> None:
     """Print hint statistics without revealing words"""
-    by_first_letter = Counter(r.word[0].upper() for r in results)
-    two_letter_starts = Counter(r.word[:2].upper() for r in results)
+    by_first_letter: Dict[str, int] = {}
+    two_letter_starts: Dict[str, int] = {}
+    for w in results.words:
+        first, start = w[0], w[:2]
+        by_first_letter[first] = by_first_letter.get(first, 0) + 1
+        two_letter_starts[start] = two_letter_starts.get(start, 0) + 1
+    # Stable sort keeps first-seen order among ties, same as Counter.most_common
+    top_starts = sorted(two_letter_starts.items(), key=lambda kv: kv[1], reverse=True)[:10]
     
     print("=== Hints (Word Counts) ===")
-    print("By first letter:", dict(sorted(by_first_letter.items())))
+    print("By first letter:", {c.upper(): n for c, n in sorted(by_first_letter.items())})
     print("\nMost common 2-letter starts:")
-    for start, count in two_letter_starts.most_common(10):
-        print(f"  {start}: {count} words")
+    for start, count in top_starts:
+        print(f"  {start.upper()}: {count} words")
     print()
 
-def print_results(results: List[WordResult], show_top_n: int = 50, show_hints: bool = False):
+def print_results(results: WordResults, show_top_n: int = 50, show_hints: bool = False):
     """Print comprehensive results"""
-    total_points = sum(r.score for r in results)
-    n_pangrams = sum(1 for r in results if r.is_pangram)
-    by_len = Counter(r.length for r in results)
+    total_points = sum(results.scores)
+    n_pangrams = sum(results.is_pangram)
+    by_len = Counter(results.lengths)
     
     print("=" * 60)
     print("=== Summary ===")
@@ -207,8 +566,8 @@ def print_results(results: List[WordResult], show_top_n: int = 50, show_hints: b
     print(f"Pangrams: {n_pangrams}")
     print(f"By length: {dict(sorted(by_len.items()))}")
     
-    if results and results[0].zipf_score > 0:
-        avg_zipf = sum(r.zipf_score for r in results) / len(results)
+    if results and results.zipf_scores[0] > 0:
+        avg_zipf = sum(results.zipf_scores) / len(results)
         print(f"Average word frequency (Zipf): {avg_zipf:.2f}")
     print()
     
@@ -225,7 +584,7 @@ def print_results(results: List[WordResult], show_top_n: int = 50, show_hints: b
     print()
     
     # Show all pangrams separately if any exist
-    pangrams = [r for r in results if r.is_pangram]
+    pangrams = results.take([i for i, pg in enumerate(results.is_pangram) if pg])
     if pangrams:
         print("=== All Pangrams ===")
         for r in pangrams:
@@ -284,6 +643,14 @@ def main():
     # Display results
     print_results(results, show_top_n=SHOW_TOP_N, show_hints=SHOW_HINTS)
     
+    # Opt-in: cache a compiled filter so later runs skip numba and the JIT
+    if BUILD_AOT_FILTER and _get_aot_filter() is None:
+        print("Compiling the word filter ahead of time for faster future runs...")
+        if not build_aot_filter():
+            print("  Skipped: needs numba and a working C compiler (failed builds are not retried;")
+            print("  call build_aot_filter(force=True) to try again)")
+        print()
+    
     # Tips
     print("=" * 60)
     if WORDFREQ_AVAILABLE: